@@ -8,17 +8,22 @@ from examples.v2.tutorial.common import get_account, get_assets
 from examples.v2.utils import get_algod
 from tinyman.v2.client import TinymanV2TestnetClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 account = get_account()
 algod = get_algod()
 client = TinymanV2TestnetClient(algod_client=algod, user_address=account["address"])
 
 ASSET_A_ID, ASSET_B_ID = get_assets()["ids"]
-ASSET_A = client.fetch_asset(ASSET_A_ID)
-ASSET_B = client.fetch_asset(ASSET_B_ID)
-pool = client.fetch_pool(ASSET_A_ID, ASSET_B_ID)
+ASSET_A, ASSET_B = client.fetch_assets([ASSET_A_ID, ASSET_B_ID])
+pool = client.fetch_pool(ASSET_A, ASSET_B)
 
-position = pool.fetch_pool_position()
+# The pool is already refreshed by fetch_pool
+position = pool.fetch_pool_position(refresh=False)
 pool_token_asset_in = position[pool.pool_token_asset].amount // 4
 
 quote = pool.fetch_remove_liquidity_quote(
@@ -36,14 +41,15 @@ txn_group.sign_with_private_key(account["address"], account["private_key"])
 # Submit transactions to the network and wait for confirmation
 txn_info = client.submit(txn_group, wait=True)
 print("Transaction Info")
-pprint(txn_info)
+if orjson:
+    print(orjson.dumps(txn_info, option=orjson.OPT_INDENT_2).decode())
+else:
+    pprint(txn_info)
 
 print(
     f"Check the transaction group on Algoexplorer: https://testnet.algoexplorer.io/tx/group/{quote_plus(txn_group.id)}"
 )
 
-pool.refresh()
-
 pool_position = pool.fetch_pool_position()
 share = pool_position["share"] * 100
 print(f"Pool Tokens: {pool_position[pool.pool_token_asset]}")
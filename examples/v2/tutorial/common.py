@@ -2,6 +2,7 @@ import json
 import os
 import string
 import random
+from functools import lru_cache
 from pprint import pprint
 
 from algosdk.future.transaction import AssetCreateTxn, wait_for_confirmation
@@ -13,6 +14,7 @@ def get_account_file_path(filename="account.json"):
     return file_path
 
 
+@lru_cache(maxsize=None)
 def get_account(filename="account.json"):
     file_path = get_account_file_path(filename)
     try:
@@ -30,6 +32,7 @@ def get_assets_file_path(filename="assets.json"):
     return file_path
 
 
+@lru_cache(maxsize=None)
 def get_assets(filename="assets.json"):
     file_path = get_account_file_path(filename)
     try:
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from algosdk.v2client.algod import AlgodClient
 
 
+@lru_cache(maxsize=1)
 def get_algod():
     # return AlgodClient(
     #     "<TOKEN>", "http://localhost:8080", headers={"User-Agent": "algosdk"}
@@ -1,8 +1,12 @@
+from base64 import b64encode
 from unittest import TestCase
+from unittest.mock import patch
 
 from algosdk.v2client.algod import AlgodClient
 
+from tinyman.assets import Asset
 from tinyman.v2.client import TinymanV2Client
+from tinyman.v2.pools import Pool
 from tests import get_suggested_params
 
 
@@ -48,3 +52,55 @@ class BaseTestCase(TestCase):
     @classmethod
     def app_call_note(cls):
         return b'tinyman/v2:j{"origin":"tinyman-py-sdk"}'
+
+    @classmethod
+    def get_pool_account_info(cls, state=None, round_number=100):
+        state = cls.pool_state if state is None else state
+        return {
+            "address": cls.pool_address,
+            "amount": 300_000,
+            "round": round_number,
+            "apps-local-state": [
+                {
+                    "id": cls.VALIDATOR_APP_ID,
+                    "key-value": [
+                        {
+                            "key": b64encode(key.encode()).decode(),
+                            "value": {"type": 2, "uint": value},
+                        }
+                        for key, value in state.items()
+                    ],
+                }
+            ],
+        }
+
+    @classmethod
+    def get_user_account_info(cls, asset_amounts):
+        return {
+            "address": cls.user_address,
+            "assets": [
+                {"asset-id": asset_id, "amount": amount}
+                for asset_id, amount in asset_amounts.items()
+            ],
+        }
+
+    @classmethod
+    def patch_account_info(cls, client, *account_infos):
+        # The mocked account_info returns the given account info of the requested address.
+        account_infos = {
+            account_info["address"]: account_info for account_info in account_infos
+        }
+        return patch.object(
+            client.algod,
+            "account_info",
+            side_effect=lambda address: account_infos[address],
+        )
+
+    @classmethod
+    def get_unrefreshed_pool(cls, client, **kwargs):
+        # Refreshing fetches the pool token asset, cache it to stay offline.
+        client.assets_cache.setdefault(
+            cls.pool_token_asset_id,
+            Asset(id=cls.pool_token_asset_id, unit_name="TMPOOL2", decimals=6),
+        )
+        return Pool(client, cls.asset_1_id, cls.asset_2_id, fetch=False, **kwargs)
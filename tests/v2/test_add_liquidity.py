@@ -126,6 +126,19 @@ class InitialAddLiquidityTestCase(BaseTestCase):
             },
         )
 
+    def test_add_liquidity_with_large_amounts(self):
+        quote = self.pool.fetch_initial_add_liquidity_quote(
+            amount_a=AssetAmount(self.pool.asset_1, 684_268_451_013_967_869),
+            amount_b=AssetAmount(self.pool.asset_2, 151_367_245_457_070_922),
+            refresh=False,
+        )
+
+        # math.isqrt is exact, math.sqrt loses precision at this scale.
+        self.assertEqual(
+            quote.pool_token_asset_amount,
+            AssetAmount(self.pool.pool_token_asset, 321_831_991_236_359_753),
+        )
+
 
 class AddLiquidityTestCase(BaseTestCase):
     @classmethod
@@ -246,6 +259,39 @@ class AddLiquidityTestCase(BaseTestCase):
             },
         )
 
+    def test_flexible_add_liquidity_with_large_reserves(self):
+        pool = Pool.from_state(
+            address=self.pool_address,
+            state=self.get_pool_state(
+                asset_1_reserves=318_833_216_361_207_408,
+                asset_2_reserves=772_769_544_516,
+                issued_pool_tokens=103_666_672_032_078,
+            ),
+            round_number=100,
+            client=self.get_tinyman_client(),
+        )
+        quote = pool.fetch_flexible_add_liquidity_quote(
+            amount_a=AssetAmount(pool.asset_1, 98_858_092_522_684_226),
+            amount_b=AssetAmount(pool.asset_2, 40_015_351_244),
+            refresh=False,
+        )
+
+        # The float formula gave 37_111_498_410_553_334 as the internal swap amount in
+        # and 111_334_495_231_660 as its fees.
+        self.assertEqual(
+            quote.pool_token_asset_amount,
+            AssetAmount(pool.pool_token_asset, 18_005_153_856_681),
+        )
+        internal_swap_quote = quote.internal_swap_quote
+        self.assertEqual(
+            internal_swap_quote.amount_in,
+            AssetAmount(pool.asset_1, 37_111_498_410_553_330),
+        )
+        self.assertEqual(
+            internal_swap_quote.swap_fees,
+            AssetAmount(pool.asset_1, 111_334_495_231_659),
+        )
+
     def test_single_asset_add_liquidity(self):
         asset_a_amount = AssetAmount(self.pool.asset_1, 10_000_000)
         quote = self.pool.fetch_single_asset_add_liquidity_quote(
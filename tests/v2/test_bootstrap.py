@@ -1,4 +1,4 @@
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 from algosdk.account import generate_account
 from algosdk.constants import APPCALL_TXN, PAYMENT_TXN
@@ -106,6 +106,32 @@ class BootstrapTestCase(BaseTestCase):
             },
         )
 
+    def test_pool_algo_balance_is_read_with_refresh(self):
+        pool = Pool(
+            client=self.get_tinyman_client(),
+            asset_a=self.asset_1_id,
+            asset_b=self.asset_2_id,
+            info=None,
+            fetch=False,
+            validator_app_id=self.VALIDATOR_APP_ID,
+        )
+        account_info = {
+            "address": self.pool_address,
+            "amount": 1_000_000,
+            "round": 100,
+            "apps-local-state": [],
+        }
+        with patch.object(
+            pool.client.algod, "account_info", return_value=account_info
+        ) as account_info_mock:
+            txn_group = pool.prepare_bootstrap_transactions(
+                suggested_params=self.get_suggested_params(),
+            )
+
+        account_info_mock.assert_called_once_with(self.pool_address)
+        self.assertEqual(pool.algo_balance, 1_000_000)
+        self.assertEqual(txn_group.transactions[0].amt, 49_000)
+
 
 class BootstrapAlgoPoolTestCase(BaseTestCase):
     @classmethod
@@ -0,0 +1,226 @@
+import time
+from threading import Barrier, Event
+from unittest.mock import Mock, patch
+
+from algosdk.account import generate_account
+
+from tests.v2 import BaseTestCase
+from tinyman.assets import Asset
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import get_pool_logicsig
+from tinyman.v2.pools import Pool, refresh_pools
+
+
+class FetchPoolTestCase(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+        cls.sender_private_key, cls.user_address = generate_account()
+        cls.asset_1_id = 10
+        cls.asset_2_id = 8
+        cls.pool_token_asset_id = 15
+        cls.pool_address = get_pool_logicsig(
+            cls.VALIDATOR_APP_ID, cls.asset_1_id, cls.asset_2_id
+        ).address()
+        cls.pool_state = cls.get_pool_state(
+            asset_1_reserves=1_000_000,
+            asset_2_reserves=100_000_000,
+            issued_pool_tokens=10_000_000,
+        )
+
+    def setUp(self):
+        self.client = self.get_tinyman_client()
+        for asset_id in (self.asset_1_id, self.asset_2_id, self.pool_token_asset_id):
+            self.client.assets_cache[asset_id] = Asset(
+                id=asset_id, unit_name=f"ASSET{asset_id}", decimals=6
+            )
+
+    def test_fetch_pool_is_cached(self):
+        with self.patch_account_info(
+            self.client, self.get_pool_account_info()
+        ) as account_info_mock:
+            pool = self.client.fetch_pool(self.asset_1_id, self.asset_2_id)
+            same_pool = self.client.fetch_pool(self.asset_2_id, self.asset_1_id)
+
+        self.assertIs(pool, same_pool)
+        self.assertEqual(pool.asset_1_reserves, 1_000_000)
+        # The cached pool is refreshed instead of being rebuilt.
+        self.assertEqual(account_info_mock.call_count, 2)
+
+    def test_fetch_pools(self):
+        with self.patch_account_info(
+            self.client, self.get_pool_account_info()
+        ) as account_info_mock:
+            pools = self.client.fetch_pools(
+                [
+                    (self.asset_1_id, self.asset_2_id),
+                    (self.asset_2_id, self.asset_1_id),
+                ]
+            )
+
+        self.assertIs(pools[0], pools[1])
+        self.assertEqual(pools[0].asset_1.unit_name, "ASSET10")
+        self.assertEqual(pools[0].issued_pool_tokens, 10_000_000)
+        self.assertIs(
+            self.client.fetch_pool(self.asset_1_id, self.asset_2_id, fetch=False),
+            pools[0],
+        )
+        account_info_mock.assert_called_once_with(self.pool_address)
+
+    def test_refresh_pools(self):
+        pools = [self.get_unrefreshed_pool(self.client) for _ in range(3)]
+        with self.patch_account_info(
+            self.client, self.get_pool_account_info()
+        ) as account_info_mock:
+            refresh_pools(pools)
+
+        self.assertEqual(account_info_mock.call_count, 3)
+        for pool in pools:
+            self.assertEqual(pool.asset_2_reserves, 100_000_000)
+            self.assertEqual(pool.last_refreshed_round, 100)
+
+    def test_refresh_pools_fetches_pool_token_assets_concurrently(self):
+        pools = []
+        account_infos = []
+        for asset_1_id, pool_token_asset_id in ((10, 15), (11, 16), (12, 17)):
+            pool = Pool(self.client, asset_1_id, self.asset_2_id, fetch=False)
+            state = self.get_pool_state(
+                asset_1_id=asset_1_id, pool_token_asset_id=pool_token_asset_id
+            )
+            account_infos.append(
+                {**self.get_pool_account_info(state), "address": pool.address}
+            )
+            pools.append(pool)
+        del self.client.assets_cache[self.pool_token_asset_id]
+        # Each asset_info request waits for the others, they only pass if they overlap.
+        barrier = Barrier(3, timeout=1)
+
+        def asset_info(asset_id):
+            barrier.wait()
+            return {"params": {"unit-name": "TMPOOL2", "decimals": 6}}
+
+        with self.patch_account_info(self.client, *account_infos), patch.object(
+            self.client.algod, "asset_info", side_effect=asset_info
+        ) as asset_info_mock:
+            refreshed_pools = refresh_pools(pools)
+
+        self.assertEqual(refreshed_pools, pools)
+        self.assertEqual(asset_info_mock.call_count, 3)
+        self.assertEqual([pool.pool_token_asset.id for pool in pools], [15, 16, 17])
+
+    def test_refresh_pools_timeout(self):
+        pool = self.get_unrefreshed_pool(self.client)
+        release_event = Event()
+        returned_event = Event()
+
+        def account_info(address):
+            release_event.wait(1)
+            returned_event.set()
+            return self.get_pool_account_info()
+
+        with patch.object(self.client.algod, "account_info", side_effect=account_info):
+            refreshed_pools = refresh_pools([pool], timeout=0.01)
+            release_event.set()
+            returned_event.wait(1)
+            time.sleep(0.05)
+
+        self.assertEqual(refreshed_pools, [])
+        # The late response is dropped, it doesn't update the pool.
+        self.assertIsNone(pool.last_refreshed_round)
+
+    def test_fetch_pool_without_fetch_is_not_cached(self):
+        pool = self.client.fetch_pool(self.asset_1_id, self.asset_2_id, fetch=False)
+
+        self.assertIsNone(pool.last_refreshed_round)
+        self.assertEqual(self.client.pools_cache, {})
+
+    def test_pools_cache_is_bounded(self):
+        self.client.pools_cache_size = 2
+        for asset_id in (11, 12):
+            self.client.assets_cache[asset_id] = Asset(
+                id=asset_id, unit_name=f"ASSET{asset_id}", decimals=6
+            )
+        with patch.object(
+            self.client.algod,
+            "account_info",
+            return_value=self.get_pool_account_info(),
+        ):
+            pools = self.client.fetch_pools([(10, 8), (11, 8), (12, 8)])
+
+        # The oldest pool is evicted.
+        self.assertEqual(list(self.client.pools_cache), [(11, 8), (12, 8)])
+        self.assertEqual(list(self.client.pools_cache.values()), pools[1:])
+
+
+class FetchAssetsTestCase(BaseTestCase):
+    VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+    user_address = None
+
+    def test_fetch_assets(self):
+        client = self.get_tinyman_client()
+
+        def asset_info(asset_id):
+            return {
+                "params": {
+                    "name": f"Asset {asset_id}",
+                    "unit-name": f"ASSET{asset_id}",
+                    "decimals": 6,
+                }
+            }
+
+        with patch.object(
+            client.algod, "asset_info", side_effect=asset_info
+        ) as asset_info_mock:
+            assets = client.fetch_assets([10, 8, 10, 0])
+            client.fetch_assets([8, 10])
+
+        self.assertEqual([asset.id for asset in assets], [10, 8, 10, 0])
+        self.assertEqual(assets[1].unit_name, "ASSET8")
+        self.assertEqual(assets[3].unit_name, "ALGO")
+        self.assertIs(assets[0], assets[2])
+        self.assertEqual(asset_info_mock.call_count, 2)
+
+
+class SubmitManyTestCase(BaseTestCase):
+    VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+    user_address = None
+
+    def test_submit_many(self):
+        client = self.get_tinyman_client()
+        transaction_groups = [
+            Mock(signed_transactions=[f"signed-{i}"]) for i in range(3)
+        ]
+
+        def send_transactions(signed_transactions):
+            return f"txid-{signed_transactions[0][-1]}"
+
+        with patch.object(
+            client.algod, "send_transactions", side_effect=send_transactions
+        ):
+            results = client.submit_many(transaction_groups)
+
+        self.assertEqual(
+            results, [{"txid": "txid-0"}, {"txid": "txid-1"}, {"txid": "txid-2"}]
+        )
+
+
+class FetchSuggestedParamsTestCase(BaseTestCase):
+    VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+    user_address = None
+
+    def test_fetch_suggested_params_is_cached(self):
+        client = self.get_tinyman_client()
+        with patch.object(
+            client.algod,
+            "suggested_params",
+            side_effect=lambda: self.get_suggested_params(),
+        ) as suggested_params_mock:
+            suggested_params = client.fetch_suggested_params()
+            suggested_params.fee = 2000
+            cached_suggested_params = client.fetch_suggested_params()
+            client.fetch_suggested_params(ttl=0)
+
+        self.assertEqual(suggested_params_mock.call_count, 2)
+        # Callers get a copy, changing it doesn't affect the cached params.
+        self.assertIsNot(suggested_params, cached_suggested_params)
+        self.assertEqual(cached_suggested_params.fee, 1000)
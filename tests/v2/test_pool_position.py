@@ -0,0 +1,142 @@
+import asyncio
+
+from algosdk.account import generate_account
+
+from tests.v2 import BaseTestCase
+from tinyman.assets import AssetAmount
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import get_pool_logicsig
+from tinyman.v2.pools import Pool, fetch_pool_positions, refresh_pools
+
+
+class PoolPositionTestCase(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+        cls.sender_private_key, cls.user_address = generate_account()
+        cls.asset_1_id = 10
+        cls.asset_2_id = 8
+        cls.pool_token_asset_id = 15
+        cls.pool_address = get_pool_logicsig(
+            cls.VALIDATOR_APP_ID, cls.asset_1_id, cls.asset_2_id
+        ).address()
+        cls.pool_state = cls.get_pool_state(
+            asset_1_reserves=1_000_000,
+            asset_2_reserves=100_000_000,
+            issued_pool_tokens=10_000_000,
+        )
+
+    def test_fetch_pool_positions(self):
+        client = self.get_tinyman_client()
+        pools = [self.get_unrefreshed_pool(client) for _ in range(2)]
+        empty_pool = Pool.from_state(
+            address=self.pool_address,
+            state={**self.pool_state, "pool_token_asset_id": 16},
+            round_number=100,
+            client=client,
+        )
+        user_account_info = self.get_user_account_info(
+            {self.asset_1_id: 1, self.pool_token_asset_id: 1_000_000}
+        )
+
+        with self.patch_account_info(
+            client, self.get_pool_account_info(), user_account_info
+        ) as account_info_mock:
+            positions = fetch_pool_positions(
+                client, pools + [empty_pool], user_address=self.user_address
+            )
+            # One request for the user and one for each pool with a position.
+            self.assertEqual(account_info_mock.call_count, 3)
+
+            for pool, position in zip(pools, positions):
+                self.assertEqual(
+                    position,
+                    pool.fetch_pool_position(self.user_address, refresh=False),
+                )
+
+        for pool, position in zip(pools, positions):
+            self.assertEqual(position[pool.asset_1], AssetAmount(pool.asset_1, 100_000))
+            self.assertEqual(position["share"], 0.1)
+        self.assertEqual(positions[2]["share"], 0.0)
+        self.assertEqual(
+            positions[2][empty_pool.pool_token_asset],
+            AssetAmount(empty_pool.pool_token_asset, 0),
+        )
+
+    def test_fetch_pool_positions_without_pool_token_asset(self):
+        client = self.get_tinyman_client()
+        pool = self.get_unrefreshed_pool(client)
+        not_bootstrapped_pool = Pool(client, self.asset_1_id, 9, fetch=False)
+        not_bootstrapped_pool_account_info = {
+            "address": not_bootstrapped_pool.address,
+            "amount": 0,
+            "round": 100,
+            "apps-local-state": [],
+        }
+        user_account_info = self.get_user_account_info(
+            {self.pool_token_asset_id: 1_000_000}
+        )
+
+        with self.patch_account_info(
+            client,
+            self.get_pool_account_info(),
+            not_bootstrapped_pool_account_info,
+            user_account_info,
+        ):
+            unrefreshed_positions = fetch_pool_positions(
+                client, [pool], user_address=self.user_address, refresh=False
+            )
+            positions = fetch_pool_positions(
+                client, [not_bootstrapped_pool, pool], user_address=self.user_address
+            )
+
+        # The pools without a pool token asset get no position.
+        self.assertEqual(unrefreshed_positions, [None])
+        self.assertIsNone(positions[0])
+        self.assertEqual(positions[1]["share"], 0.1)
+
+    def test_fetch_pool_position_async(self):
+        client = self.get_tinyman_client()
+        pools = [self.get_unrefreshed_pool(client) for _ in range(2)]
+        user_account_info = self.get_user_account_info(
+            {self.pool_token_asset_id: 1_000_000}
+        )
+
+        async def fetch_positions():
+            return await asyncio.gather(
+                *(pool.fetch_pool_position_async(self.user_address) for pool in pools)
+            )
+
+        with self.patch_account_info(
+            client, self.get_pool_account_info(), user_account_info
+        ):
+            # The pool token asset is known after the first refresh.
+            refresh_pools(pools)
+            positions = asyncio.run(fetch_positions())
+
+        for pool, position in zip(pools, positions):
+            self.assertEqual(
+                position[pool.asset_2], AssetAmount(pool.asset_2, 10_000_000)
+            )
+            self.assertEqual(position["share"], 0.1)
+
+    def test_fetch_empty_pool_position(self):
+        client = self.get_tinyman_client()
+        pool = Pool.from_state(
+            address=self.pool_address,
+            state=self.pool_state,
+            round_number=100,
+            client=client,
+        )
+        user_account_info = self.get_user_account_info({self.asset_1_id: 1_000})
+        with self.patch_account_info(client, user_account_info) as account_info_mock:
+            position = pool.fetch_pool_position(self.user_address)
+
+        # The pool isn't refreshed for an empty position.
+        account_info_mock.assert_called_once_with(self.user_address)
+        self.assertEqual(position[pool.asset_1], AssetAmount(pool.asset_1, 0))
+        self.assertEqual(position[pool.asset_2], AssetAmount(pool.asset_2, 0))
+        self.assertEqual(
+            position[pool.pool_token_asset], AssetAmount(pool.pool_token_asset, 0)
+        )
+        self.assertEqual(position["share"], 0.0)
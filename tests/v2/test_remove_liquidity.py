@@ -119,6 +119,74 @@ class RemoveLiquidityTestCase(BaseTestCase):
             },
         )
 
+    def test_remove_liquidity_with_large_reserves(self):
+        pool = Pool.from_state(
+            address=self.pool_address,
+            state=self.get_pool_state(
+                asset_1_reserves=9_000_000_000_000_000_001,
+                asset_2_reserves=100_000_000,
+                issued_pool_tokens=10_000_000_000_000_000,
+            ),
+            round_number=100,
+            client=self.get_tinyman_client(),
+        )
+        quote = pool.fetch_remove_liquidity_quote(
+            pool_token_asset_in=3_333_333_333_333_333, refresh=False
+        )
+
+        # The float formula gave 2_999_999_999_999_999_488 as the asset 1 amount out.
+        self.assertEqual(
+            quote.amounts_out[pool.asset_1],
+            AssetAmount(pool.asset_1, 2_999_999_999_999_999_700),
+        )
+        self.assertEqual(
+            quote.amounts_out[pool.asset_2],
+            AssetAmount(pool.asset_2, 33_333_333),
+        )
+
+    def test_remove_liquidity_without_slippage(self):
+        quote = self.pool.fetch_remove_liquidity_quote(
+            pool_token_asset_in=5_000_000, slippage=0, refresh=False
+        )
+        single_asset_quote = self.pool.fetch_single_asset_remove_liquidity_quote(
+            pool_token_asset_in=5_000_000,
+            output_asset=self.pool.asset_1,
+            slippage=0,
+            refresh=False,
+        )
+
+        amounts_out_with_slippage = quote.amounts_out_with_slippage
+        amount_out_with_slippage = single_asset_quote.amount_out_with_slippage
+        self.assertEqual(amounts_out_with_slippage, quote.amounts_out)
+        self.assertEqual(amount_out_with_slippage, single_asset_quote.amount_out)
+
+        # The amounts with slippage are copies, changing them doesn't change the quotes.
+        amounts_out_with_slippage[self.pool.asset_1].amount = 0
+        amount_out_with_slippage.amount = 0
+        self.assertEqual(
+            quote.amounts_out[self.pool.asset_1],
+            AssetAmount(self.pool.asset_1, 500_000),
+        )
+        self.assertEqual(
+            single_asset_quote.amount_out, AssetAmount(self.pool.asset_1, 749_624)
+        )
+
+    def test_quote_context(self):
+        client = self.get_tinyman_client()
+        pool = self.get_unrefreshed_pool(client)
+        with self.patch_account_info(
+            client, self.get_pool_account_info()
+        ) as account_info_mock:
+            with pool.quote_context():
+                pool.fetch_remove_liquidity_quote(pool_token_asset_in=5_000)
+                pool.fetch_single_asset_remove_liquidity_quote(
+                    pool_token_asset_in=5_000, output_asset=pool.asset_1
+                )
+            self.assertEqual(account_info_mock.call_count, 1)
+
+            pool.fetch_remove_liquidity_quote(pool_token_asset_in=5_000)
+            self.assertEqual(account_info_mock.call_count, 2)
+
     def test_single_asset_remove_liquidity(self):
         quote = self.pool.fetch_single_asset_remove_liquidity_quote(
             pool_token_asset_in=5_000_000, output_asset=self.pool.asset_1, refresh=False
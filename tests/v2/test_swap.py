@@ -1,4 +1,6 @@
-from unittest.mock import ANY
+import asyncio
+from threading import Event
+from unittest.mock import ANY, patch
 
 from algosdk.account import generate_account
 from algosdk.constants import ASSETTRANSFER_TXN, APPCALL_TXN
@@ -16,7 +18,7 @@ from tinyman.v2.constants import (
     TESTNET_VALIDATOR_APP_ID_V2,
 )
 from tinyman.v2.contracts import get_pool_logicsig
-from tinyman.v2.pools import Pool
+from tinyman.v2.pools import Pool, fetch_swap_quotes
 from tinyman.v2.quotes import SwapQuote
 
 
@@ -108,6 +110,185 @@ class SwapTestCase(BaseTestCase):
             },
         )
 
+    def test_fixed_input_swap_quotes(self):
+        amounts_in = [
+            AssetAmount(self.pool.asset_1, 10_000_000),
+            AssetAmount(self.pool.asset_2, 1_000_000),
+        ]
+        quotes = self.pool.fetch_fixed_input_swap_quotes(
+            amounts_in=amounts_in, refresh=False
+        )
+
+        self.assertEqual(
+            quotes,
+            [
+                self.pool.fetch_fixed_input_swap_quote(
+                    amount_in=amount_in, refresh=False
+                )
+                for amount_in in amounts_in
+            ],
+        )
+
+    def test_swap_with_large_reserves(self):
+        pool = Pool.from_state(
+            address=self.pool_address,
+            state=self.get_pool_state(
+                asset_1_reserves=123_456_789_012_345_678,
+                asset_2_reserves=987_654_321_098,
+                issued_pool_tokens=10_000_000_000_000,
+            ),
+            round_number=100,
+            client=self.get_tinyman_client(),
+        )
+        fixed_input_quote = pool.fetch_fixed_input_swap_quote(
+            amount_in=AssetAmount(pool.asset_2, 10_000_000_000), refresh=False
+        )
+        fixed_output_quote = pool.fetch_fixed_output_swap_quote(
+            amount_out=AssetAmount(pool.asset_2, 123_456_789_012), refresh=False
+        )
+
+        # The float formula gave 1_233_795_287_887_901 as the fixed input amount out.
+        self.assertEqual(
+            fixed_input_quote.amount_out,
+            AssetAmount(pool.asset_1, 1_233_795_287_887_908),
+        )
+        self.assertEqual(
+            fixed_output_quote.amount_in,
+            AssetAmount(pool.asset_1, 17_689_753_220_568_232),
+        )
+
+    def test_fetch_fixed_input_swap_quote_async(self):
+        client = self.get_tinyman_client()
+        pools = [self.get_unrefreshed_pool(client) for _ in range(3)]
+
+        async def fetch_quotes():
+            return await asyncio.gather(
+                *(
+                    pool.fetch_fixed_input_swap_quote_async(
+                        AssetAmount(pool.asset_1, 10_000)
+                    )
+                    for pool in pools
+                )
+            )
+
+        with self.patch_account_info(
+            client, self.get_pool_account_info()
+        ) as account_info_mock:
+            quotes = asyncio.run(fetch_quotes())
+
+        self.assertEqual(account_info_mock.call_count, 3)
+        for pool, quote in zip(pools, quotes):
+            self.assertEqual(pool.last_refreshed_round, 100)
+            self.assertEqual(
+                quote, pool.fetch_fixed_input_swap_quote(quote.amount_in, refresh=False)
+            )
+
+    def test_fetch_swap_quotes(self):
+        client = self.get_tinyman_client()
+        pools = [self.get_unrefreshed_pool(client) for _ in range(2)]
+        with self.patch_account_info(
+            client, self.get_pool_account_info()
+        ) as account_info_mock:
+            quotes = fetch_swap_quotes(
+                pools, amount_in=AssetAmount(pools[0].asset_1, 10_000)
+            )
+
+        self.assertEqual(account_info_mock.call_count, 2)
+        for pool, quote in zip(pools, quotes):
+            self.assertEqual(
+                quote,
+                pool.fetch_fixed_input_swap_quote(quote.amount_in, refresh=False),
+            )
+
+    def test_fetch_swap_quotes_without_liquidity(self):
+        client = self.get_tinyman_client()
+        pool = self.get_unrefreshed_pool(client)
+        empty_pool = Pool(client, self.asset_1_id, 0, fetch=False)
+        not_bootstrapped_pool = Pool(client, self.asset_1_id, 9, fetch=False)
+        empty_pool_account_info = {
+            **self.get_pool_account_info({**self.pool_state, "issued_pool_tokens": 0}),
+            "address": empty_pool.address,
+        }
+        not_bootstrapped_pool_account_info = {
+            "address": not_bootstrapped_pool.address,
+            "amount": 0,
+            "round": 100,
+            "apps-local-state": [],
+        }
+
+        with self.patch_account_info(
+            client,
+            self.get_pool_account_info(),
+            empty_pool_account_info,
+            not_bootstrapped_pool_account_info,
+        ):
+            quotes = fetch_swap_quotes(
+                [empty_pool, pool, not_bootstrapped_pool],
+                amount_in=AssetAmount(pool.asset_1, 10_000),
+            )
+
+        # The pools that can't be quoted get no quote, the others are still quoted.
+        self.assertEqual(
+            quotes,
+            [
+                None,
+                pool.fetch_fixed_input_swap_quote(
+                    AssetAmount(pool.asset_1, 10_000), refresh=False
+                ),
+                None,
+            ],
+        )
+
+    def test_fetch_swap_quotes_with_timeout(self):
+        client = self.get_tinyman_client()
+        fast_pool = self.get_unrefreshed_pool(client)
+        slow_pool = Pool(client, self.asset_1_id, 0, fetch=False)
+        release_event = Event()
+
+        def account_info(address):
+            if address == slow_pool.address:
+                release_event.wait(1)
+            return self.get_pool_account_info()
+
+        with patch.object(client.algod, "account_info", side_effect=account_info):
+            quotes = fetch_swap_quotes(
+                [fast_pool, slow_pool],
+                amount_in=AssetAmount(fast_pool.asset_1, 10_000),
+                timeout=0.05,
+            )
+            release_event.set()
+
+        # The pool that didn't refresh in time gets no quote.
+        self.assertEqual(
+            quotes,
+            [
+                fast_pool.fetch_fixed_input_swap_quote(
+                    AssetAmount(fast_pool.asset_1, 10_000), refresh=False
+                ),
+                None,
+            ],
+        )
+        self.assertIsNone(slow_pool.last_refreshed_round)
+
+    def test_refresh_ttl(self):
+        client = self.get_tinyman_client()
+        pool = self.get_unrefreshed_pool(client, refresh_ttl=60)
+        amount_in = AssetAmount(pool.asset_1, 10_000)
+        with self.patch_account_info(
+            client, self.get_pool_account_info()
+        ) as account_info_mock:
+            pool.fetch_fixed_input_swap_quote(amount_in)
+            pool.fetch_fixed_input_swap_quote(amount_in)
+            self.assertEqual(account_info_mock.call_count, 1)
+
+            # Explicit refreshes always reload the pool.
+            pool.refresh()
+            self.assertEqual(account_info_mock.call_count, 2)
+
+            pool.refresh_ttl = 0
+            pool.fetch_fixed_input_swap_quote(amount_in)
+            self.assertEqual(account_info_mock.call_count, 3)
+
     def test_fixed_output_swap(self):
         quote = self.pool.fetch_fixed_output_swap_quote(
             amount_out=AssetAmount(self.pool.asset_2, 499_248_873), refresh=False
@@ -20,7 +20,7 @@ class Asset:
         return f"Asset({self.unit_name} - {self.id})"
 
     def __eq__(self, other) -> bool:
-        return self.id == other.id
+        return isinstance(other, Asset) and self.id == other.id
 
     def fetch(self, algod):
         if self.id > 0:
@@ -39,6 +39,8 @@ class Asset:
 
 @dataclass
 class AssetAmount:
+    __slots__ = ("asset", "amount")
+
     asset: Asset
     amount: int
 
@@ -1,6 +1,9 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from typing import Optional
 
-from algosdk.future.transaction import wait_for_confirmation
+from algosdk.future.transaction import SuggestedParams, wait_for_confirmation
 from algosdk.v2client.algod import AlgodClient
 
 from tinyman.assets import Asset
@@ -21,6 +24,8 @@ class BaseTinymanClient:
         self.validator_app_id = validator_app_id
         self.staking_app_id = staking_app_id
         self.assets_cache = {}
+        # (suggested_params, monotonic time), replaced in a single assignment.
+        self._suggested_params_cache = None
         self.user_address = user_address
         self.client_name = client_name
 
@@ -34,17 +39,51 @@ class BaseTinymanClient:
             self.assets_cache[asset_id] = asset
         return self.assets_cache[asset_id]
 
-    def submit(self, transaction_group, wait=False):
+    def fetch_assets(self, asset_ids, max_workers=4):
+        missing_asset_ids = [
+            asset_id
+            for asset_id in dict.fromkeys(asset_ids)
+            if asset_id not in self.assets_cache
+        ]
+        if len(missing_asset_ids) > 1:
+            # Asset lookups are independent, overlap the algod round-trips.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self.fetch_asset, missing_asset_ids))
+        return [self.fetch_asset(asset_id) for asset_id in asset_ids]
+
+    def fetch_suggested_params(self, ttl: float = 4.0) -> SuggestedParams:
+        # Suggested params are valid for many rounds, reuse them for a few seconds.
+        now = time.monotonic()
+        cache = self._suggested_params_cache
+        if cache is None or now - cache[1] >= ttl:
+            cache = (self.algod.suggested_params(), now)
+            self._suggested_params_cache = cache
+        return copy(cache[0])
+
+    def submit(self, transaction_group, wait=False, wait_rounds=0):
         try:
             txid = self.algod.send_transactions(transaction_group.signed_transactions)
         except Exception as e:
             self.handle_error(e, transaction_group)
         if wait:
-            txn_info = wait_for_confirmation(self.algod, txid)
+            txn_info = wait_for_confirmation(self.algod, txid, wait_rounds)
             txn_info["txid"] = txid
             return txn_info
         return {"txid": txid}
 
+    def submit_many(self, transaction_groups, wait=False, wait_rounds=0, max_workers=4):
+        # Groups are submitted and confirmed concurrently, results keep the given order.
+        # If a submission fails its error is raised, the other groups may still be submitted.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda transaction_group: self.submit(
+                        transaction_group, wait=wait, wait_rounds=wait_rounds
+                    ),
+                    transaction_groups,
+                )
+            )
+
     def handle_error(self, exception, transaction_group):
         error_message = str(exception)
         raise Exception(error_message) from None
@@ -54,7 +93,7 @@ class BaseTinymanClient:
     ):
         user_address = user_address or self.user_address
         if suggested_params is None:
-            suggested_params = self.algod.suggested_params()
+            suggested_params = self.fetch_suggested_params()
         txn_group = prepare_asset_optin_transactions(
             asset_id=asset_id,
             sender=user_address,
@@ -233,13 +233,15 @@ class TransactionGroup:
             if txn.sender == address:
                 self.signed_transactions[i] = txn.sign(private_key)
 
-    def submit(self, algod, wait=False):
+    def submit(self, algod, wait=False, wait_rounds=0):
         try:
             txid = algod.send_transactions(self.signed_transactions)
         except AlgodHTTPError as e:
             raise Exception(e) from None
         if wait:
-            txn_info = wait_for_confirmation(algod, txid)
+            # wait_for_confirmation blocks on status_after_block between checks,
+            # wait_rounds=0 keeps the algosdk default of 1000 rounds.
+            txn_info = wait_for_confirmation(algod, txid, wait_rounds)
             txn_info["txid"] = txid
             return txn_info
         return {"txid": txid}
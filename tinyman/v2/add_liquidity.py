@@ -14,7 +14,7 @@ from .constants import (
     ADD_LIQUIDITY_SINGLE_MODE_APP_ARGUMENT,
     ADD_INITIAL_LIQUIDITY_APP_ARGUMENT,
 )
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address
 
 
 def prepare_flexible_add_liquidity_transactions(
@@ -29,8 +29,7 @@ def prepare_flexible_add_liquidity_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     txns = [
         AssetTransferTxn(
@@ -89,8 +88,7 @@ def prepare_single_asset_add_liquidity_transactions(
     asset_2_amount: Optional[int] = None,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     assert bool(asset_1_amount) != bool(
         asset_2_amount
@@ -156,8 +154,7 @@ def prepare_initial_add_liquidity_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     txns = [
         AssetTransferTxn(
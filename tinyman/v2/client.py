@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Optional
 
 from algosdk.v2client.algod import AlgodClient
@@ -17,11 +18,77 @@ from .utils import lookup_error
 from tinyman.errors import LogicError
 
 
+def get_pool_key(asset_a, asset_b):
+    asset_a_id = asset_a if isinstance(asset_a, int) else asset_a.id
+    asset_b_id = asset_b if isinstance(asset_b, int) else asset_b.id
+    return max(asset_a_id, asset_b_id), min(asset_a_id, asset_b_id)
+
+
 class TinymanV2Client(BaseTinymanClient):
+    pools_cache_size = 128
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        validator_app_id: int,
+        user_address: Optional[str] = None,
+        staking_app_id: Optional[int] = None,
+        client_name: Optional[str] = None,
+    ):
+        super().__init__(
+            algod_client,
+            validator_app_id=validator_app_id,
+            user_address=user_address,
+            staking_app_id=staking_app_id,
+            client_name=client_name,
+        )
+        # The oldest pools are evicted past pools_cache_size (FIFO).
+        self.pools_cache = OrderedDict()
+
+    def _cache_pool(self, key, pool):
+        self.pools_cache[key] = pool
+        while len(self.pools_cache) > self.pools_cache_size:
+            self.pools_cache.popitem(last=False)
+
     def fetch_pool(self, asset_a, asset_b, fetch=True):
         from .pools import Pool
 
-        return Pool(self, asset_a, asset_b, fetch=fetch)
+        key = get_pool_key(asset_a, asset_b)
+        pool = self.pools_cache.get(key)
+        if pool is None:
+            pool = Pool(self, asset_a, asset_b, fetch=fetch)
+            # Only fetched pools are cached, they have complete asset details.
+            if fetch:
+                self._cache_pool(key, pool)
+        elif fetch:
+            pool.refresh()
+        return pool
+
+    def fetch_pools(self, asset_pairs, fetch=True):
+        from .pools import Pool, refresh_pools
+
+        if not fetch:
+            return [
+                self.fetch_pool(asset_a, asset_b, fetch=False)
+                for asset_a, asset_b in asset_pairs
+            ]
+
+        keys = [get_pool_key(asset_a, asset_b) for asset_a, asset_b in asset_pairs]
+        # Prefetch all assets of the new pools in one concurrent pass.
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self.pools_cache]
+        self.fetch_assets([asset_id for key in new_keys for asset_id in key])
+
+        pools = {
+            key: self.pools_cache.get(key)
+            or Pool(
+                self, self.fetch_asset(key[0]), self.fetch_asset(key[1]), fetch=False
+            )
+            for key in dict.fromkeys(keys)
+        }
+        refresh_pools(list(pools.values()))
+        for key, pool in pools.items():
+            self._cache_pool(key, pool)
+        return [pools[key] for key in keys]
 
     def handle_error(self, exception, txn_group):
         error = parse_error(exception)
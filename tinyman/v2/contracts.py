@@ -1,9 +1,12 @@
 from base64 import b64decode
+from functools import lru_cache
 
 from algosdk.future.transaction import LogicSigAccount
 
 from tinyman.v2.constants import POOL_LOGICSIG_TEMPLATE
 
+pool_logicsig_template = b64decode(POOL_LOGICSIG_TEMPLATE)
+
 
 def get_pool_logicsig(
     validator_app_id: int, asset_a_id: int, asset_b_id: int
@@ -12,8 +15,15 @@ def get_pool_logicsig(
     asset_1_id = max(assets)
     asset_2_id = min(assets)
 
-    program = bytearray(b64decode(POOL_LOGICSIG_TEMPLATE))
+    program = bytearray(pool_logicsig_template)
     program[3:11] = validator_app_id.to_bytes(8, "big")
     program[11:19] = asset_1_id.to_bytes(8, "big")
     program[19:27] = asset_2_id.to_bytes(8, "big")
     return LogicSigAccount(program)
+
+
+@lru_cache(maxsize=4096)
+def get_pool_address(validator_app_id: int, asset_a_id: int, asset_b_id: int) -> str:
+    # Only the address is cached, LogicSigAccount instances are mutable.
+    pool_logicsig = get_pool_logicsig(validator_app_id, asset_a_id, asset_b_id)
+    return pool_logicsig.address()
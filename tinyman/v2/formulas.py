@@ -32,7 +32,7 @@ def calculate_fixed_output_fee_amount(swap_amount: int, total_fee_share: int) ->
 
 
 def calculate_internal_swap_fee_amount(swap_amount: int, total_fee_share: int) -> int:
-    total_fee_amount = int((swap_amount * total_fee_share) / (10_000 - total_fee_share))
+    total_fee_amount = (swap_amount * total_fee_share) // (10_000 - total_fee_share)
     return total_fee_amount
 
 
@@ -131,7 +131,7 @@ def calculate_initial_add_liquidity(asset_1_amount: int, asset_2_amount: int) ->
     ), "Both assets are required for the initial add liquidity"
 
     pool_token_asset_amount = (
-        int(math.sqrt(asset_1_amount * asset_2_amount)) - LOCKED_POOL_TOKENS
+        math.isqrt(asset_1_amount * asset_2_amount) - LOCKED_POOL_TOKENS
     )
     return pool_token_asset_amount
 
@@ -144,16 +144,16 @@ def calculate_remove_liquidity_output_amounts(
 ) -> (int, int):
     if issued_pool_tokens > (pool_token_asset_amount + LOCKED_POOL_TOKENS):
         asset_1_output_amount = (
-            pool_token_asset_amount * asset_1_reserves / issued_pool_tokens
+            pool_token_asset_amount * asset_1_reserves // issued_pool_tokens
         )
         asset_2_output_amount = (
-            pool_token_asset_amount * asset_2_reserves / issued_pool_tokens
+            pool_token_asset_amount * asset_2_reserves // issued_pool_tokens
         )
     else:
         asset_1_output_amount = asset_1_reserves
         asset_2_output_amount = asset_2_reserves
 
-    return int(asset_1_output_amount), int(asset_2_output_amount)
+    return asset_1_output_amount, asset_2_output_amount
 
 
 def calculate_subsequent_add_liquidity(
@@ -170,17 +170,15 @@ def calculate_subsequent_add_liquidity(
     new_asset_1_reserves = asset_1_reserves + asset_1_amount
     new_asset_2_reserves = asset_2_reserves + asset_2_amount
     new_k = new_asset_1_reserves * new_asset_2_reserves
-    new_issued_pool_tokens = int(
-        math.sqrt(int((new_k * (issued_pool_tokens**2)) / old_k))
-    )
+    new_issued_pool_tokens = math.isqrt((new_k * (issued_pool_tokens**2)) // old_k)
 
     pool_token_asset_amount = new_issued_pool_tokens - issued_pool_tokens
-    calculated_asset_1_amount = int(
-        (pool_token_asset_amount * new_asset_1_reserves) / new_issued_pool_tokens
-    )
-    calculated_asset_2_amount = int(
-        (pool_token_asset_amount * new_asset_2_reserves) / new_issued_pool_tokens
-    )
+    calculated_asset_1_amount = (
+        pool_token_asset_amount * new_asset_1_reserves
+    ) // new_issued_pool_tokens
+    calculated_asset_2_amount = (
+        pool_token_asset_amount * new_asset_2_reserves
+    ) // new_issued_pool_tokens
 
     asset_1_swap_amount = asset_1_amount - calculated_asset_1_amount
     asset_2_swap_amount = asset_2_amount - calculated_asset_2_amount
@@ -194,8 +192,8 @@ def calculate_subsequent_add_liquidity(
             swap_in_amount_without_fee,
             total_fee_share,
         )
-        fee_as_pool_tokens = int(
-            swap_total_fee_amount * new_issued_pool_tokens / (new_asset_1_reserves * 2)
+        fee_as_pool_tokens = (swap_total_fee_amount * new_issued_pool_tokens) // (
+            new_asset_1_reserves * 2
         )
         swap_in_amount = swap_in_amount_without_fee + swap_total_fee_amount
         pool_token_asset_amount = pool_token_asset_amount - fee_as_pool_tokens
@@ -208,8 +206,8 @@ def calculate_subsequent_add_liquidity(
             swap_in_amount_without_fee,
             total_fee_share,
         )
-        fee_as_pool_tokens = int(
-            swap_total_fee_amount * new_issued_pool_tokens / (new_asset_2_reserves * 2)
+        fee_as_pool_tokens = (swap_total_fee_amount * new_issued_pool_tokens) // (
+            new_asset_2_reserves * 2
         )
         swap_in_amount = swap_in_amount_without_fee + swap_total_fee_amount
         pool_token_asset_amount = pool_token_asset_amount - fee_as_pool_tokens
@@ -238,7 +236,7 @@ def calculate_output_amount_of_fixed_input_swap(
     input_supply: int, output_supply: int, swap_amount: int
 ) -> int:
     k = input_supply * output_supply
-    output_amount = output_supply - int(k / (input_supply + swap_amount))
+    output_amount = output_supply - (k // (input_supply + swap_amount))
     output_amount -= 1
     return output_amount
 
@@ -249,7 +247,7 @@ def calculate_swap_amount_of_fixed_output_swap(
     assert output_supply > output_amount
 
     k = input_supply * output_supply
-    swap_amount = int(k / (output_supply - output_amount)) - input_supply
+    swap_amount = (k // (output_supply - output_amount)) - input_supply
     swap_amount += 1
     return swap_amount
 
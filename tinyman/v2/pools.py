@@ -1,4 +1,9 @@
-from typing import Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from typing import Optional, Union
 
 from algosdk.future.transaction import LogicSigAccount, Transaction, SuggestedParams
 from algosdk.v2client.algod import AlgodClient
@@ -14,7 +19,7 @@ from .add_liquidity import (
 from .bootstrap import prepare_bootstrap_transactions
 from .client import TinymanV2Client
 from .constants import MIN_POOL_BALANCE_ASA_ALGO_PAIR, MIN_POOL_BALANCE_ASA_ASA_PAIR
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address, get_pool_logicsig
 from .exceptions import (
     PoolAlreadyBootstrapped,
     PoolIsNotBootstrapped,
@@ -50,23 +55,30 @@ from .remove_liquidity import (
     prepare_single_asset_remove_liquidity_transactions,
 )
 from .swap import prepare_swap_transactions
-from .utils import get_state_from_account_info
+from .utils import get_state_from_app_local_state
 
 
-def generate_pool_info(address, validator_app_id, round_number, state):
+def generate_pool_info(
+    address, validator_app_id, round_number, state, algo_balance=None
+):
     return {
         "address": address,
         "validator_app_id": validator_app_id,
         "round": round_number,
+        "algo_balance": algo_balance,
         **state,
     }
 
 
 def get_pool_info(
-    client: AlgodClient, validator_app_id: int, asset_1_id: int, asset_2_id: int
+    client: AlgodClient,
+    validator_app_id: int,
+    asset_1_id: int,
+    asset_2_id: int,
+    pool_address: Optional[str] = None,
 ) -> dict:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    if pool_address is None:
+        pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
     account_info = client.account_info(pool_address)
     pool_state = get_pool_state_from_account_info(account_info)
 
@@ -75,6 +87,7 @@ def get_pool_info(
         validator_app_id=validator_app_id,
         round_number=account_info.get("round"),
         state=pool_state,
+        algo_balance=account_info.get("amount"),
     )
 
 
@@ -86,20 +99,46 @@ def get_validator_app_id_from_account_info(account_info: dict) -> Optional[int]:
 
 
 def get_pool_state_from_account_info(account_info: dict) -> dict:
-    if validator_app_id := get_validator_app_id_from_account_info(account_info):
-        return get_state_from_account_info(account_info, validator_app_id)
-    return {}
+    # Pool accounts only opt in to the validator app, its local state is the first one.
+    try:
+        validator_app_local_state = account_info["apps-local-state"][0]
+    except IndexError:
+        return {}
+    return get_state_from_app_local_state(validator_app_local_state)
 
 
 class Pool:
+    __slots__ = (
+        "client",
+        "validator_app_id",
+        "asset_1",
+        "asset_2",
+        "exists",
+        "pool_token_asset",
+        "asset_1_reserves",
+        "asset_2_reserves",
+        "issued_pool_tokens",
+        "asset_1_protocol_fees",
+        "asset_2_protocol_fees",
+        "total_fee_share",
+        "protocol_fee_ratio",
+        "last_refreshed_round",
+        "algo_balance",
+        "_address",
+        "_in_quote_context",
+        "refresh_ttl",
+        "_refreshed_at",
+    )
+
     def __init__(
         self,
         client: TinymanV2Client,
-        asset_a: [Asset, int],
-        asset_b: [Asset, int],
+        asset_a: Union[Asset, int],
+        asset_b: Union[Asset, int],
         info=None,
         fetch=True,
         validator_app_id=None,
+        refresh_ttl: Optional[float] = None,
     ) -> None:
         self.client = client
         self.validator_app_id = (
@@ -108,6 +147,9 @@ class Pool:
             else client.validator_app_id
         )
 
+        if fetch and isinstance(asset_a, int) and isinstance(asset_b, int):
+            asset_a, asset_b = client.fetch_assets([asset_a, asset_b])
+
         if isinstance(asset_a, int):
             if fetch:
                 asset_a = client.fetch_asset(asset_a)
@@ -136,6 +178,15 @@ class Pool:
         self.total_fee_share = None
         self.protocol_fee_ratio = None
         self.last_refreshed_round = None
+        self.algo_balance = None
+
+        # The pool assets never change, the address is built once.
+        self._address: Optional[str] = None
+        self._in_quote_context = False
+
+        # Quotes skip their refresh if the pool was refreshed within refresh_ttl seconds.
+        self.refresh_ttl = refresh_ttl
+        self._refreshed_at: Optional[float] = None
 
         if fetch:
             self.refresh()
@@ -161,6 +212,7 @@ class Pool:
             validator_app_id=client.validator_app_id,
             round_number=account_info["round"],
             state=state,
+            algo_balance=account_info.get("amount"),
         )
 
         pool = Pool(
@@ -203,15 +255,51 @@ class Pool:
 
     def refresh(self, info: Optional[dict] = None) -> None:
         if info is None:
-            info = get_pool_info(
-                self.client.algod,
-                self.validator_app_id,
-                self.asset_1.id,
-                self.asset_2.id,
-            )
+            info = self._fetch_info()
         self.update_from_info(info)
+        self._refreshed_at = time.monotonic()
+
+    def _fetch_info(self) -> dict:
+        return get_pool_info(
+            self.client.algod,
+            self.validator_app_id,
+            self.asset_1.id,
+            self.asset_2.id,
+            pool_address=self.address,
+        )
+
+    async def refresh_async(self) -> None:
+        # algod client is blocking, the request runs in the default executor.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.refresh)
+
+    @contextmanager
+    def quote_context(self):
+        # Quotes fetched in the context share a single refresh.
+        self._refresh_quote_state()
+        in_quote_context = self._in_quote_context
+        self._in_quote_context = True
+        try:
+            yield self
+        finally:
+            self._in_quote_context = in_quote_context
+
+    def _is_quote_state_fresh(self) -> bool:
+        if self._in_quote_context:
+            return True
+        return (
+            self.refresh_ttl is not None
+            and self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < self.refresh_ttl
+        )
+
+    def _refresh_quote_state(self) -> None:
+        if not self._is_quote_state_fresh():
+            self.refresh()
 
     def update_from_info(self, info: dict, fetch: bool = True) -> None:
+        self.algo_balance = info.get("algo_balance")
+
         if info.get("pool_token_asset_id"):
             self.exists = True
             if fetch:
@@ -240,9 +328,11 @@ class Pool:
 
     @property
     def address(self) -> str:
-        logicsig = self.get_logicsig()
-        pool_address = logicsig.address()
-        return pool_address
+        if self._address is None:
+            self._address = get_pool_address(
+                self.validator_app_id, self.asset_1.id, self.asset_2.id
+            )
+        return self._address
 
     @property
     def asset_1_price(self) -> float:
@@ -285,9 +375,9 @@ class Pool:
         if not self.issued_pool_tokens:
             raise PoolHasNoLiquidity()
 
-        if amount.asset == self.asset_1:
+        if amount.asset.id == self.asset_1.id:
             return AssetAmount(self.asset_2, int(amount.amount * self.asset_1_price))
-        elif amount.asset == self.asset_2:
+        elif amount.asset.id == self.asset_2.id:
             return AssetAmount(self.asset_1, int(amount.amount * self.asset_2_price))
 
         raise NotImplementedError()
@@ -300,7 +390,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_asset_optin_transactions(
             asset_id=self.pool_token_asset.id,
@@ -309,14 +399,60 @@ class Pool:
         )
         return txn_group
 
-    def fetch_pool_position(self, user_address: Optional[str] = None) -> dict:
+    async def prepare_pool_token_asset_optin_transactions_async(
+        self,
+        user_address: Optional[str] = None,
+        suggested_params: SuggestedParams = None,
+    ) -> TransactionGroup:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.prepare_pool_token_asset_optin_transactions,
+                user_address=user_address,
+                suggested_params=suggested_params,
+            ),
+        )
+
+    def fetch_pool_position(
+        self, user_address: Optional[str] = None, refresh: bool = True
+    ) -> dict:
         user_address = user_address or self.client.user_address
         account_info = self.client.algod.account_info(user_address)
-        assets = {a["asset-id"]: a for a in account_info["assets"]}
-        pool_token_asset_amount = assets.get(self.pool_token_asset.id, {}).get(
-            "amount", 0
+        pool_token_asset_id = self.pool_token_asset.id
+        pool_token_asset_amount = 0
+        for asset in account_info["assets"]:
+            if asset["asset-id"] == pool_token_asset_id:
+                pool_token_asset_amount = asset["amount"]
+                break
+        # An empty position doesn't depend on the pool state.
+        if refresh and pool_token_asset_amount:
+            self._refresh_quote_state()
+        return self._get_pool_position(pool_token_asset_amount)
+
+    async def fetch_pool_position_async(
+        self, user_address: Optional[str] = None, refresh: bool = True
+    ) -> dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.fetch_pool_position, user_address=user_address, refresh=refresh
+            ),
+        )
+
+    def _get_pool_position(self, pool_token_asset_amount: int) -> dict:
+        if not pool_token_asset_amount:
+            return {
+                self.asset_1: AssetAmount(self.asset_1, 0),
+                self.asset_2: AssetAmount(self.asset_2, 0),
+                self.pool_token_asset: AssetAmount(self.pool_token_asset, 0),
+                "share": 0.0,
+            }
+
+        quote = self.fetch_remove_liquidity_quote(
+            pool_token_asset_amount, refresh=False
         )
-        quote = self.fetch_remove_liquidity_quote(pool_token_asset_amount)
         return {
             self.asset_1: quote.amounts_out[self.asset_1],
             self.asset_2: quote.amounts_out[self.asset_2],
@@ -341,11 +477,13 @@ class Pool:
             raise PoolAlreadyBootstrapped()
 
         if pool_algo_balance is None:
-            pool_account_info = self.client.algod.account_info(self.address)
-            pool_algo_balance = pool_account_info["amount"]
+            # The balance is read from the same account info as the pool state.
+            if self.algo_balance is None:
+                self.refresh()
+            pool_algo_balance = self.algo_balance
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         if self.asset_2.id == 0:
             pool_minimum_balance = MIN_POOL_BALANCE_ASA_ALGO_PAIR
@@ -384,11 +522,11 @@ class Pool:
             amount_b.asset,
         }, "Pool assets and given assets don't match."
 
-        amount_1 = amount_a if amount_a.asset == self.asset_1 else amount_b
-        amount_2 = amount_a if amount_a.asset == self.asset_2 else amount_b
+        amount_1 = amount_a if amount_a.asset.id == self.asset_1.id else amount_b
+        amount_2 = amount_a if amount_a.asset.id == self.asset_2.id else amount_b
 
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -416,19 +554,15 @@ class Pool:
             # There is no output amount, ignore the integer roundings looks like a swap.
             internal_swap_quote = None
         else:
+            swap_asset_in, swap_asset_out = (
+                (self.asset_1, self.asset_2)
+                if swap_from_asset_1_to_asset_2
+                else (self.asset_2, self.asset_1)
+            )
             internal_swap_quote = InternalSwapQuote(
-                amount_in=AssetAmount(
-                    self.asset_1 if swap_from_asset_1_to_asset_2 else self.asset_2,
-                    swap_in_amount,
-                ),
-                amount_out=AssetAmount(
-                    self.asset_2 if swap_from_asset_1_to_asset_2 else self.asset_1,
-                    swap_out_amount,
-                ),
-                swap_fees=AssetAmount(
-                    self.asset_1 if swap_from_asset_1_to_asset_2 else self.asset_2,
-                    swap_total_fee_amount,
-                ),
+                amount_in=AssetAmount(swap_asset_in, swap_in_amount),
+                amount_out=AssetAmount(swap_asset_out, swap_out_amount),
+                swap_fees=AssetAmount(swap_asset_in, swap_total_fee_amount),
                 price_impact=swap_price_impact,
             )
 
@@ -449,7 +583,7 @@ class Pool:
         self, amount_a: AssetAmount, slippage: float = 0.05, refresh: bool = True
     ) -> SingleAssetAddLiquidityQuote:
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -457,7 +591,7 @@ class Pool:
         if not self.issued_pool_tokens:
             raise PoolHasNoLiquidity()
 
-        if amount_a.asset == self.asset_1:
+        if amount_a.asset.id == self.asset_1.id:
             (
                 pool_token_asset_amount,
                 swap_from_asset_1_to_asset_2,
@@ -473,7 +607,7 @@ class Pool:
                 asset_1_amount=amount_a.amount,
                 asset_2_amount=0,
             )
-        elif amount_a.asset == self.asset_2:
+        elif amount_a.asset.id == self.asset_2.id:
             (
                 pool_token_asset_amount,
                 swap_from_asset_1_to_asset_2,
@@ -492,19 +626,15 @@ class Pool:
         else:
             assert False, "Given asset doesn't belong to the pool assets."
 
+        swap_asset_in, swap_asset_out = (
+            (self.asset_1, self.asset_2)
+            if swap_from_asset_1_to_asset_2
+            else (self.asset_2, self.asset_1)
+        )
         internal_swap_quote = InternalSwapQuote(
-            amount_in=AssetAmount(
-                self.asset_1 if swap_from_asset_1_to_asset_2 else self.asset_2,
-                swap_in_amount,
-            ),
-            amount_out=AssetAmount(
-                self.asset_2 if swap_from_asset_1_to_asset_2 else self.asset_1,
-                swap_out_amount,
-            ),
-            swap_fees=AssetAmount(
-                self.asset_1 if swap_from_asset_1_to_asset_2 else self.asset_2,
-                swap_total_fee_amount,
-            ),
+            amount_in=AssetAmount(swap_asset_in, swap_in_amount),
+            amount_out=AssetAmount(swap_asset_out, swap_out_amount),
+            swap_fees=AssetAmount(swap_asset_in, swap_total_fee_amount),
             price_impact=swap_price_impact,
         )
         quote = SingleAssetAddLiquidityQuote(
@@ -528,11 +658,11 @@ class Pool:
             amount_b.asset,
         }, "Pool assets and given assets don't match."
 
-        amount_1 = amount_a if amount_a.asset == self.asset_1 else amount_b
-        amount_2 = amount_a if amount_a.asset == self.asset_2 else amount_b
+        amount_1 = amount_a if amount_a.asset.id == self.asset_1.id else amount_b
+        amount_2 = amount_a if amount_a.asset.id == self.asset_2.id else amount_b
 
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -566,7 +696,7 @@ class Pool:
         asset_2_amount = amounts_in[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_flexible_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -592,7 +722,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_single_asset_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -600,10 +730,10 @@ class Pool:
             asset_2_id=self.asset_2.id,
             pool_token_asset_id=self.pool_token_asset.id,
             asset_1_amount=amount_in.amount
-            if amount_in.asset == self.asset_1
+            if amount_in.asset.id == self.asset_1.id
             else None,
             asset_2_amount=amount_in.amount
-            if amount_in.asset == self.asset_2
+            if amount_in.asset.id == self.asset_2.id
             else None,
             min_pool_token_asset_amount=min_pool_token_asset_amount,
             sender=user_address,
@@ -623,7 +753,7 @@ class Pool:
         asset_2_amount = amounts_in[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_initial_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -640,7 +770,7 @@ class Pool:
 
     def prepare_add_liquidity_transactions_from_quote(
         self,
-        quote: [
+        quote: Union[
             FlexibleAddLiquidityQuote,
             SingleAssetAddLiquidityQuote,
             InitialAddLiquidityQuote,
@@ -673,7 +803,7 @@ class Pool:
 
     def fetch_remove_liquidity_quote(
         self,
-        pool_token_asset_in: [AssetAmount, int],
+        pool_token_asset_in: Union[AssetAmount, int],
         slippage: float = 0.05,
         refresh: bool = True,
     ) -> RemoveLiquidityQuote:
@@ -686,7 +816,7 @@ class Pool:
             )
 
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         (
             asset_1_output_amount,
@@ -709,7 +839,7 @@ class Pool:
 
     def fetch_single_asset_remove_liquidity_quote(
         self,
-        pool_token_asset_in: [AssetAmount, int],
+        pool_token_asset_in: Union[AssetAmount, int],
         output_asset: Asset,
         slippage: float = 0.05,
         refresh: bool = True,
@@ -723,7 +853,7 @@ class Pool:
             )
 
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         (
             asset_1_output_amount,
@@ -735,64 +865,49 @@ class Pool:
             issued_pool_tokens=self.issued_pool_tokens,
         )
 
-        if output_asset == self.asset_1:
-            (
-                swap_output_amount,
-                total_fee_amount,
-                price_impact,
-            ) = calculate_fixed_input_swap(
-                input_supply=self.asset_2_reserves - asset_2_output_amount,
-                output_supply=self.asset_1_reserves - asset_1_output_amount,
-                swap_input_amount=asset_2_output_amount,
-                total_fee_share=self.total_fee_share,
-            )
-            internal_swap_quote = InternalSwapQuote(
-                amount_in=AssetAmount(self.asset_2, asset_2_output_amount),
-                amount_out=AssetAmount(self.asset_1, swap_output_amount),
-                swap_fees=AssetAmount(self.asset_2, total_fee_amount),
-                price_impact=price_impact,
-            )
-            quote = SingleAssetRemoveLiquidityQuote(
-                amount_out=AssetAmount(
-                    self.asset_1, asset_1_output_amount + swap_output_amount
-                ),
-                pool_token_asset_amount=pool_token_asset_in,
-                slippage=slippage,
-                internal_swap_quote=internal_swap_quote,
-            )
-        elif output_asset == self.asset_2:
-            (
-                swap_output_amount,
-                total_fee_amount,
-                price_impact,
-            ) = calculate_fixed_input_swap(
-                input_supply=self.asset_1_reserves - asset_1_output_amount,
-                output_supply=self.asset_2_reserves - asset_2_output_amount,
-                swap_input_amount=asset_1_output_amount,
-                total_fee_share=self.total_fee_share,
-            )
-            internal_swap_quote = InternalSwapQuote(
-                amount_in=AssetAmount(self.asset_1, asset_1_output_amount),
-                amount_out=AssetAmount(self.asset_2, swap_output_amount),
-                swap_fees=AssetAmount(self.asset_1, total_fee_amount),
-                price_impact=price_impact,
-            )
-            quote = SingleAssetRemoveLiquidityQuote(
-                amount_out=AssetAmount(
-                    self.asset_2, asset_2_output_amount + swap_output_amount
-                ),
-                pool_token_asset_amount=pool_token_asset_in,
-                slippage=slippage,
-                internal_swap_quote=internal_swap_quote,
-            )
+        if output_asset.id == self.asset_1.id:
+            swap_asset_in, swap_asset_out = self.asset_2, self.asset_1
+            swap_input_amount = asset_2_output_amount
+            output_amount = asset_1_output_amount
+            input_supply = self.asset_2_reserves - asset_2_output_amount
+            output_supply = self.asset_1_reserves - asset_1_output_amount
+        elif output_asset.id == self.asset_2.id:
+            swap_asset_in, swap_asset_out = self.asset_1, self.asset_2
+            swap_input_amount = asset_1_output_amount
+            output_amount = asset_2_output_amount
+            input_supply = self.asset_1_reserves - asset_1_output_amount
+            output_supply = self.asset_2_reserves - asset_2_output_amount
         else:
-            assert False
+            assert False, "Given asset doesn't belong to the pool assets."
+
+        (
+            swap_output_amount,
+            total_fee_amount,
+            price_impact,
+        ) = calculate_fixed_input_swap(
+            input_supply=input_supply,
+            output_supply=output_supply,
+            swap_input_amount=swap_input_amount,
+            total_fee_share=self.total_fee_share,
+        )
+        internal_swap_quote = InternalSwapQuote(
+            amount_in=AssetAmount(swap_asset_in, swap_input_amount),
+            amount_out=AssetAmount(swap_asset_out, swap_output_amount),
+            swap_fees=AssetAmount(swap_asset_in, total_fee_amount),
+            price_impact=price_impact,
+        )
+        quote = SingleAssetRemoveLiquidityQuote(
+            amount_out=AssetAmount(swap_asset_out, output_amount + swap_output_amount),
+            pool_token_asset_amount=pool_token_asset_in,
+            slippage=slippage,
+            internal_swap_quote=internal_swap_quote,
+        )
 
         return quote
 
     def prepare_remove_liquidity_transactions(
         self,
-        pool_token_asset_amount: [AssetAmount, int],
+        pool_token_asset_amount: Union[AssetAmount, int],
         amounts_out: "dict[Asset, AssetAmount]",
         user_address: Optional[str] = None,
         suggested_params: SuggestedParams = None,
@@ -807,7 +922,7 @@ class Pool:
         asset_2_amount = amounts_out[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_remove_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -825,7 +940,7 @@ class Pool:
 
     def prepare_single_asset_remove_liquidity_transactions(
         self,
-        pool_token_asset_amount: [AssetAmount, int],
+        pool_token_asset_amount: Union[AssetAmount, int],
         amount_out: AssetAmount,
         user_address: Optional[str] = None,
         suggested_params: SuggestedParams = None,
@@ -838,7 +953,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_single_asset_remove_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -856,7 +971,7 @@ class Pool:
 
     def prepare_remove_liquidity_transactions_from_quote(
         self,
-        quote: [RemoveLiquidityQuote, SingleAssetRemoveLiquidityQuote],
+        quote: Union[RemoveLiquidityQuote, SingleAssetRemoveLiquidityQuote],
         user_address: Optional[str] = None,
         suggested_params: SuggestedParams = None,
     ) -> TransactionGroup:
@@ -886,7 +1001,7 @@ class Pool:
         self, amount_in: AssetAmount, slippage: float = 0.05, refresh: bool = True
     ) -> SwapQuote:
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -894,16 +1009,16 @@ class Pool:
         if not self.issued_pool_tokens:
             raise PoolHasNoLiquidity()
 
-        if amount_in.asset == self.asset_1:
+        if amount_in.asset.id == self.asset_1.id:
             asset_out = self.asset_2
             input_supply = self.asset_1_reserves
             output_supply = self.asset_2_reserves
-        elif amount_in.asset == self.asset_2:
+        elif amount_in.asset.id == self.asset_2.id:
             asset_out = self.asset_1
             input_supply = self.asset_2_reserves
             output_supply = self.asset_1_reserves
         else:
-            assert False
+            assert False, "Given asset doesn't belong to the pool assets."
 
         swap_output_amount, total_fee_amount, price_impact = calculate_fixed_input_swap(
             input_supply=input_supply,
@@ -923,11 +1038,38 @@ class Pool:
         )
         return quote
 
+    async def fetch_fixed_input_swap_quote_async(
+        self, amount_in: AssetAmount, slippage: float = 0.05, refresh: bool = True
+    ) -> SwapQuote:
+        if refresh and not self._is_quote_state_fresh():
+            await self.refresh_async()
+
+        return self.fetch_fixed_input_swap_quote(
+            amount_in=amount_in, slippage=slippage, refresh=False
+        )
+
+    def fetch_fixed_input_swap_quotes(
+        self,
+        amounts_in: "list[AssetAmount]",
+        slippage: float = 0.05,
+        refresh: bool = True,
+    ) -> "list[SwapQuote]":
+        # All quotes are calculated from a single pool state.
+        if refresh:
+            self._refresh_quote_state()
+
+        return [
+            self.fetch_fixed_input_swap_quote(
+                amount_in=amount_in, slippage=slippage, refresh=False
+            )
+            for amount_in in amounts_in
+        ]
+
     def fetch_fixed_output_swap_quote(
         self, amount_out: AssetAmount, slippage: float = 0.05, refresh: bool = True
     ) -> SwapQuote:
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -935,16 +1077,17 @@ class Pool:
         if not self.issued_pool_tokens:
             raise PoolHasNoLiquidity()
 
-        if amount_out.asset == self.asset_1:
+        asset_out_id = amount_out.asset.id
+        if asset_out_id == self.asset_1.id:
             asset_in = self.asset_2
             input_supply = self.asset_2_reserves
             output_supply = self.asset_1_reserves
-        elif amount_out.asset == self.asset_2:
+        elif asset_out_id == self.asset_2.id:
             asset_in = self.asset_1
             input_supply = self.asset_1_reserves
             output_supply = self.asset_2_reserves
         else:
-            assert False
+            assert False, "Given asset doesn't belong to the pool assets."
 
         swap_input_amount, total_fee_amount, price_impact = calculate_fixed_output_swap(
             input_supply=input_supply,
@@ -952,13 +1095,12 @@ class Pool:
             swap_output_amount=amount_out.amount,
             total_fee_share=self.total_fee_share,
         )
-        amount_in = AssetAmount(asset_in, swap_input_amount)
 
         quote = SwapQuote(
             swap_type="fixed-output",
             amount_out=amount_out,
-            amount_in=amount_in,
-            swap_fees=AssetAmount(amount_in.asset, total_fee_amount),
+            amount_in=AssetAmount(asset_in, swap_input_amount),
+            swap_fees=AssetAmount(asset_in, total_fee_amount),
             slippage=slippage,
             price_impact=price_impact,
         )
@@ -968,14 +1110,14 @@ class Pool:
         self,
         amount_in: AssetAmount,
         amount_out: AssetAmount,
-        swap_type: [str, bytes],
+        swap_type: Union[str, bytes],
         user_address: str = None,
         suggested_params: SuggestedParams = None,
     ) -> TransactionGroup:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_swap_transactions(
             validator_app_id=self.validator_app_id,
@@ -991,6 +1133,27 @@ class Pool:
         )
         return txn_group
 
+    async def prepare_swap_transactions_async(
+        self,
+        amount_in: AssetAmount,
+        amount_out: AssetAmount,
+        swap_type: Union[str, bytes],
+        user_address: str = None,
+        suggested_params: SuggestedParams = None,
+    ) -> TransactionGroup:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.prepare_swap_transactions,
+                amount_in=amount_in,
+                amount_out=amount_out,
+                swap_type=swap_type,
+                user_address=user_address,
+                suggested_params=suggested_params,
+            ),
+        )
+
     def prepare_swap_transactions_from_quote(
         self,
         quote: SwapQuote,
@@ -1027,7 +1190,7 @@ class Pool:
             loan_amount_2 = loan_amount_b
 
         if refresh:
-            self.refresh()
+            self._refresh_quote_state()
 
         if not self.exists:
             raise PoolIsNotBootstrapped()
@@ -1096,7 +1259,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         txn_group = prepare_flash_loan_transactions(
             validator_app_id=self.validator_app_id,
@@ -1139,7 +1302,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         return prepare_claim_fees_transactions(
             validator_app_id=self.validator_app_id,
@@ -1161,7 +1324,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self.client.fetch_suggested_params()
 
         return prepare_set_fee_transactions(
             validator_app_id=self.validator_app_id,
@@ -1171,3 +1334,119 @@ class Pool:
             fee_manager=user_address,
             suggested_params=suggested_params,
         )
+
+
+def refresh_pools(
+    pools: "list[Pool]", max_workers: int = 8, timeout: Optional[float] = None
+) -> "list[Pool]":
+    # Each refresh is an independent account_info request, overlap them. The pools
+    # are updated here, a request that doesn't finish in time leaves its pool as is.
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [executor.submit(pool._fetch_info) for pool in pools]
+    done, not_done = wait(futures, timeout=timeout)
+    for future in not_done:
+        future.cancel()
+    executor.shutdown(wait=False)
+
+    # Updating a pool fetches its pool token asset, prefetch them concurrently.
+    pool_token_asset_ids = {}
+    for pool, future in zip(pools, futures):
+        if future in done and future.exception() is None:
+            if future.result().get("pool_token_asset_id"):
+                pool_token_asset_ids.setdefault(pool.client, []).append(
+                    future.result()["pool_token_asset_id"]
+                )
+    for client, asset_ids in pool_token_asset_ids.items():
+        client.fetch_assets(asset_ids)
+
+    refreshed_pools = []
+    for pool, future in zip(pools, futures):
+        if future in done and future.exception() is None:
+            pool.refresh(future.result())
+            refreshed_pools.append(pool)
+    for future in futures:
+        if future in done and future.exception() is not None:
+            raise future.exception()
+    return refreshed_pools
+
+
+def fetch_swap_quotes(
+    pools: "list[Pool]",
+    amount_in: Optional[AssetAmount] = None,
+    amount_out: Optional[AssetAmount] = None,
+    slippage: float = 0.05,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+) -> "list[Optional[SwapQuote]]":
+    assert (amount_in is None) != (
+        amount_out is None
+    ), "Either amount_in or amount_out must be given."
+
+    # Pools that are not refreshed within the timeout or have no liquidity to swap
+    # against get no quote (None).
+    refreshed_pools = refresh_pools(pools, max_workers=max_workers, timeout=timeout)
+    quotes = []
+    for pool in pools:
+        if (
+            pool not in refreshed_pools
+            or not pool.exists
+            or not pool.issued_pool_tokens
+        ):
+            quotes.append(None)
+        elif amount_in is not None:
+            quotes.append(
+                pool.fetch_fixed_input_swap_quote(
+                    amount_in=amount_in, slippage=slippage, refresh=False
+                )
+            )
+        else:
+            quotes.append(
+                pool.fetch_fixed_output_swap_quote(
+                    amount_out=amount_out, slippage=slippage, refresh=False
+                )
+            )
+    return quotes
+
+
+def fetch_pool_positions(
+    client: TinymanV2Client,
+    pools: "list[Pool]",
+    user_address: Optional[str] = None,
+    refresh: bool = True,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+) -> "list[Optional[dict]]":
+    # One account_info request covers the positions in all pools.
+    user_address = user_address or client.user_address
+    account_info = client.algod.account_info(user_address)
+    pool_token_amounts = {a["asset-id"]: a["amount"] for a in account_info["assets"]}
+
+    pools_to_refresh = refreshed_pools = []
+    if refresh:
+        # Empty positions don't depend on the pool state. The pools with an unknown
+        # pool token asset are refreshed to find it.
+        pools_to_refresh = [
+            pool
+            for pool in pools
+            if pool.pool_token_asset is None
+            or pool_token_amounts.get(pool.pool_token_asset.id, 0)
+        ]
+        refreshed_pools = refresh_pools(
+            pools_to_refresh, max_workers=max_workers, timeout=timeout
+        )
+
+    # Pools that are not refreshed within the timeout or have no pool token asset
+    # (not bootstrapped or never refreshed) get no position (None).
+    positions = []
+    for pool in pools:
+        if pool.pool_token_asset is None or (
+            pool in pools_to_refresh and pool not in refreshed_pools
+        ):
+            positions.append(None)
+        else:
+            positions.append(
+                pool._get_pool_position(
+                    pool_token_amounts.get(pool.pool_token_asset.id, 0)
+                )
+            )
+    return positions
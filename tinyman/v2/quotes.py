@@ -6,6 +6,15 @@ from tinyman.assets import AssetAmount, Asset
 
 @dataclass
 class SwapQuote:
+    __slots__ = (
+        "swap_type",
+        "amount_in",
+        "amount_out",
+        "swap_fees",
+        "slippage",
+        "price_impact",
+    )
+
     swap_type: str
     amount_in: AssetAmount
     amount_out: AssetAmount
@@ -98,6 +107,12 @@ class RemoveLiquidityQuote:
 
     @property
     def amounts_out_with_slippage(self) -> "dict[Asset, AssetAmount]":
+        if not self.slippage:
+            return {
+                asset: AssetAmount(asset_amount.asset, asset_amount.amount)
+                for asset, asset_amount in self.amounts_out.items()
+            }
+
         amounts_out = {}
         for asset, asset_amount in self.amounts_out.items():
             amount_with_slippage = asset_amount.amount - int(
@@ -116,6 +131,9 @@ class SingleAssetRemoveLiquidityQuote:
 
     @property
     def amount_out_with_slippage(self) -> AssetAmount:
+        if not self.slippage:
+            return AssetAmount(self.amount_out.asset, self.amount_out.amount)
+
         amount_with_slippage = self.amount_out.amount - int(
             self.amount_out.amount * self.slippage
         )
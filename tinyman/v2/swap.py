@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union
 
 from algosdk.future.transaction import (
     ApplicationNoOpTxn,
@@ -13,7 +13,14 @@ from .constants import (
     FIXED_INPUT_APP_ARGUMENT,
     FIXED_OUTPUT_APP_ARGUMENT,
 )
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address
+
+SWAP_TYPE_APP_ARGUMENTS = {
+    "fixed-input": FIXED_INPUT_APP_ARGUMENT,
+    "fixed-output": FIXED_OUTPUT_APP_ARGUMENT,
+    FIXED_INPUT_APP_ARGUMENT: FIXED_INPUT_APP_ARGUMENT,
+    FIXED_OUTPUT_APP_ARGUMENT: FIXED_OUTPUT_APP_ARGUMENT,
+}
 
 
 def prepare_swap_transactions(
@@ -23,13 +30,16 @@ def prepare_swap_transactions(
     asset_in_id: int,
     asset_in_amount: int,
     asset_out_amount: int,
-    swap_type: [str, bytes],
+    swap_type: Union[str, bytes],
     sender: str,
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    if swap_type not in SWAP_TYPE_APP_ARGUMENTS:
+        raise NotImplementedError()
+    swap_type = SWAP_TYPE_APP_ARGUMENTS[swap_type]
+
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     txns = [
         AssetTransferTxn(
@@ -57,22 +67,13 @@ def prepare_swap_transactions(
         ),
     ]
 
-    if isinstance(swap_type, bytes):
-        pass
-    elif isinstance(swap_type, str):
-        swap_type = swap_type.encode()
-    else:
-        raise NotImplementedError()
-
     min_fee = suggested_params.min_fee
     if swap_type == FIXED_INPUT_APP_ARGUMENT:
         # App call contains 1 inner transaction
         app_call_fee = min_fee * 2
-    elif swap_type == FIXED_OUTPUT_APP_ARGUMENT:
+    else:
         # App call contains 2 inner transactions
         app_call_fee = min_fee * 3
-    else:
-        raise NotImplementedError()
 
     txns[-1].fee = app_call_fee
     txn_group = TransactionGroup(txns)
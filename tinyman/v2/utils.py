@@ -1,10 +1,10 @@
 import importlib.resources
 import json
 from base64 import b64decode
+from functools import lru_cache
 
 import tinyman.v2
 from tinyman.tealishmap import TealishMap
-from tinyman.utils import bytes_to_int
 
 tealishmap = TealishMap(
     json.loads(importlib.resources.read_text(tinyman.v2, "amm_approval.map.json"))
@@ -26,17 +26,29 @@ def decode_logs(logs: "list") -> dict:
     return decoded_logs
 
 
+@lru_cache(maxsize=256)
+def decode_state_key(key: str) -> str:
+    # Apps use a fixed set of state keys, decode each of them once.
+    return b64decode(key).decode()
+
+
 def get_state_from_account_info(account_info, app_id):
-    try:
-        app = [a for a in account_info["apps-local-state"] if a["id"] == app_id][0]
-    except IndexError:
+    app = next(
+        (a for a in account_info.get("apps-local-state", []) if a["id"] == app_id),
+        None,
+    )
+    if app is None:
         return {}
+    return get_state_from_app_local_state(app)
+
+
+def get_state_from_app_local_state(app_local_state):
     try:
         app_state = {}
-        for x in app["key-value"]:
-            key = b64decode(x["key"]).decode()
+        for x in app_local_state["key-value"]:
+            key = decode_state_key(x["key"])
             if x["value"]["type"] == 1:
-                value = bytes_to_int(b64decode(x["value"].get("bytes", "")))
+                value = int.from_bytes(b64decode(x["value"].get("bytes", "")), "big")
             else:
                 value = x["value"].get("uint", 0)
             app_state[key] = value